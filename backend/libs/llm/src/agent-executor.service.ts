@@ -438,26 +438,38 @@ export class AgentExecutorService {
   ): Promise<string[]> {
     // RAG: Retrieve relevant context documents and memories
     // This is a simplified version - full implementation would use embeddings
-    const contextDocs = await this.prisma.contextDocument.findMany({
-      where: {
-        OR: [{ agentId }, { organizationId, agentId: null }],
-      },
-      take: 5,
-    });
-
-    const memories = await this.prisma.agentMemory.findMany({
-      where: {
-        agentId,
-        scope: { in: ['agent', 'global'] },
-      },
-      take: 5,
-    });
+    const [contextDocs, memories] = await Promise.all([
+      this.prisma.contextDocument.findMany({
+        where: {
+          OR: [{ agentId }, { organizationId, agentId: null }],
+        },
+        select: { title: true, content: true },
+        take: 5,
+      }),
+      this.prisma.agentMemory.findMany({
+        where: {
+          agentId,
+          scope: { in: ['agent', 'global'] },
+        },
+        select: { key: true, value: true },
+        take: 5,
+      }),
+    ]);
 
     const contexts: string[] = [];
 
     for (const doc of contextDocs) {
       if (doc.content) {
-        contexts.push(`[Document: ${doc.title}]\n${doc.content.substring(0, 1000)}`);
+        // Drop trailing spaces, inner space runs and extra blank lines so more of the budget
+        // holds actual text; leading indentation is kept so code and nested lists stay intact
+        const content = doc.content
+          .slice(0, 4000)
+          .replace(/\r\n/g, '\n')
+          .replace(/[ \t]+$/gm, '')
+          .replace(/(\S)[ \t]{2,}/g, '$1 ')
+          .replace(/\n{3,}/g, '\n\n')
+          .trimEnd();
+        contexts.push(`[Document: ${doc.title}]\n${content.substring(0, 1000)}`);
       }
     }
 
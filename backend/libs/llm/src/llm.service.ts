@@ -7,6 +7,7 @@ import { OpenAIProvider } from './providers/openai.provider';
 @Injectable()
 export class LlmService {
   private providers: Map<string, ModelProvider> = new Map();
+  private readonly defaultProvider: string;
 
   constructor(
     private configService: ConfigService,
@@ -15,14 +16,13 @@ export class LlmService {
   ) {
     this.providers.set('anthropic', anthropicProvider);
     this.providers.set('openai', openaiProvider);
+    this.defaultProvider = this.configService.get<string>('LLM_PROVIDER') || 'anthropic';
   }
 
   private getProvider(modelAlias?: string): ModelProvider {
-    const defaultProvider = this.configService.get<string>('LLM_PROVIDER') || 'anthropic';
-
     // Map model alias to provider
     // e.g., "claude-3-5-sonnet" -> anthropic, "gpt-4" -> openai
-    let providerName = defaultProvider;
+    let providerName = this.defaultProvider;
 
     if (modelAlias) {
       if (modelAlias.includes('claude')) {
@@ -8,6 +8,7 @@ import {
   StreamChunk,
   Message,
 } from '../interfaces/model-provider.interface';
+import { getClientOptions } from './client-options';
 
 @Injectable()
 export class AnthropicProvider implements ModelProvider {
@@ -16,7 +17,7 @@ export class AnthropicProvider implements ModelProvider {
   constructor(private configService: ConfigService) {
     const apiKey = this.configService.get<string>('ANTHROPIC_API_KEY');
     if (apiKey) {
-      this.client = new Anthropic({ apiKey });
+      this.client = new Anthropic({ apiKey, ...getClientOptions(this.configService) });
     }
   }
 
@@ -0,0 +1,39 @@
+import { ConfigService } from '@nestjs/config';
+
+/**
+ * Optional SDK client overrides shared by the model providers.
+ * Unset or invalid values are omitted so the SDK defaults apply.
+ */
+export function getClientOptions(configService: ConfigService): {
+  maxRetries?: number;
+  timeout?: number;
+} {
+  const options: { maxRetries?: number; timeout?: number } = {};
+
+  const maxRetries = readNonNegativeInteger(configService, 'LLM_MAX_RETRIES');
+  if (maxRetries !== undefined) {
+    options.maxRetries = maxRetries;
+  }
+
+  const timeout = readNonNegativeInteger(configService, 'LLM_TIMEOUT_MS');
+  if (timeout !== undefined) {
+    options.timeout = timeout;
+  }
+
+  return options;
+}
+
+function readNonNegativeInteger(configService: ConfigService, key: string): number | undefined {
+  const raw = configService.get<string>(key);
+  if (raw === undefined || raw.trim() === '') {
+    return undefined;
+  }
+
+  const value = Number(raw);
+  if (!Number.isInteger(value) || value < 0) {
+    console.warn(`Ignoring invalid ${key}="${raw}", using the SDK default`);
+    return undefined;
+  }
+
+  return value;
+}
@@ -7,6 +7,7 @@ import {
   GenerateResponse,
   StreamChunk,
 } from '../interfaces/model-provider.interface';
+import { getClientOptions } from './client-options';
 
 @Injectable()
 export class OpenAIProvider implements ModelProvider {
@@ -15,7 +16,7 @@ export class OpenAIProvider implements ModelProvider {
   constructor(private configService: ConfigService) {
     const apiKey = this.configService.get<string>('OPENAI_API_KEY');
     if (apiKey) {
-      this.client = new OpenAI({ apiKey });
+      this.client = new OpenAI({ apiKey, ...getClientOptions(this.configService) });
     }
   }
 